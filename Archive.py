@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+from sqlalchemy import select, insert, delete, literal, or_, and_
+from Extensions import db, hub
+from Database import (Event, Roster, ArchivedEvent, ArchivedRoster, event_employee, event_resource,
+                      archived_event_employee, archived_event_resource)
+
+DEFAULT_ARCHIVE_AFTER_DAYS = 365
+DEFAULT_BATCH_SIZE = 500
+
+# live association table -> archive copy; both keyed by event_id
+EVENT_LINKS = (
+    (event_employee, archived_event_employee),
+    (event_resource, archived_event_resource),
+)
+
+
+def archive_cutoff(days=DEFAULT_ARCHIVE_AFTER_DAYS, now=None):
+    return (now or datetime.now()) - timedelta(days=days)
+
+
+def archive_events(cutoff, batch_size=DEFAULT_BATCH_SIZE):
+    """Move events that finished before `cutoff` (with their staff/resource links) into the archive tables.
+
+    Work is done in batches of `batch_size` events, each in its own transaction,
+    so a large backlog never holds the database lock for long. Returns the
+    number of events moved.
+    """
+    events = Event.__table__
+    # events without an end time are judged by their start time; undated events are never archived
+    finished = or_(events.c.end_time < cutoff, and_(events.c.end_time.is_(None), events.c.start_time < cutoff))
+    moved = 0
+    while True:
+        rows = db.session.execute(
+            select(events).where(finished).order_by(events.c.id).limit(batch_size)
+        ).mappings().all()
+        if not rows:
+            break
+        ids = [row['id'] for row in rows]
+        try:
+            copies = {}
+            for row in rows:
+                data = dict(row)
+                copies[row['id']] = ArchivedEvent(event_id=data.pop('id'), **data)
+            db.session.add_all(copies.values())
+            db.session.flush()
+
+            for live, archived in EVENT_LINKS:
+                links = db.session.execute(select(live).where(live.c.event_id.in_(ids))).mappings().all()
+                if links:
+                    db.session.execute(insert(archived), [
+                        dict(link, event_id=copies[link['event_id']].id) for link in links
+                    ])
+                db.session.execute(delete(live).where(live.c.event_id.in_(ids)))
+            db.session.execute(delete(events).where(events.c.id.in_(ids)))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        # bulk deletes bypass the session hooks in Broadcast.track_changes
+        hub.notify('event', deleted=ids)
+        moved += len(ids)
+    return moved
+
+
+def archive_rosters(cutoff, batch_size=DEFAULT_BATCH_SIZE):
+    """Move rosters dated before `cutoff` into the archive table in batches. Returns the number moved."""
+    rosters = Roster.__table__
+    cutoff_date = cutoff.date() if isinstance(cutoff, datetime) else cutoff
+    moved = 0
+    while True:
+        ids = db.session.execute(
+            select(rosters.c.id).where(rosters.c.date < cutoff_date).order_by(rosters.c.id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+        try:
+            db.session.execute(insert(ArchivedRoster.__table__).from_select(
+                ['roster_id', 'date', 'shift_name', 'employee_id', 'job_description', 'archived_at'],
+                select(rosters.c.id, rosters.c.date, rosters.c.shift_name, rosters.c.employee_id,
+                       rosters.c.job_description, literal(datetime.utcnow()))
+                .where(rosters.c.id.in_(ids))
+            ))
+            db.session.execute(delete(rosters).where(rosters.c.id.in_(ids)))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        hub.notify('roster', deleted=ids)
+        moved += len(ids)
+    return moved
+
+
+def archive_before(cutoff, batch_size=DEFAULT_BATCH_SIZE):
+    """Archive both events and rosters older than `cutoff`; returns {'events': n, 'rosters': n}."""
+    return {
+        'events': archive_events(cutoff, batch_size),
+        'rosters': archive_rosters(cutoff, batch_size),
+    }
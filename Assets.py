@@ -0,0 +1,171 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip variants are produced
+    brotli = None
+
+
+# bundle name -> source files (relative to the static folder), concatenated in order
+BUNDLES = {
+    'app.css': ['Css/styles.css'],
+    'auth.css': ['Css/styles.css', 'Css/auth.css'],
+    'users.css': ['Css/users.css'],
+    'app.js': ['Js/live.js'],
+    'events.js': ['Js/events.js'],
+    'users.js': ['Js/users.js'],
+}
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+# anything smaller than this is not worth compressing
+MIN_COMPRESS_SIZE = 500
+COMPRESSIBLE_TYPES = {'text/html', 'text/css', 'application/javascript', 'text/javascript'}
+
+
+_CSS_STRINGS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+
+
+def _compact_css(css):
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}')
+
+
+def minify_css(source):
+    """Drop comments and redundant whitespace; string literals are left untouched."""
+    # odd indexes of the split are the quoted strings themselves
+    parts = _CSS_STRINGS.split(source)
+    return ''.join(part if i % 2 else _compact_css(part) for i, part in enumerate(parts)).strip()
+
+
+def minify_js(source):
+    """Conservative JS minification: strip indentation, blank lines and whole-line // comments.
+
+    A full tokenizer would be needed to safely go further (regex literals,
+    template strings), so statements themselves are never rewritten.
+    """
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def _minify(name, source):
+    if name.endswith('.css'):
+        return minify_css(source)
+    if name.endswith('.js'):
+        return minify_js(source)
+    return source
+
+
+def _write_atomic(path, data):
+    """Write via a temp file + rename so a crash or a concurrently starting worker never leaves a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates owner-only files
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _is_current(path, data, decode=None):
+    """Whether `path` already holds exactly `data` (after `decode`, for compressed variants)."""
+    try:
+        with open(path, 'rb') as fh:
+            stored = fh.read()
+        return (decode(stored) if decode else stored) == data
+    except Exception:  # missing, unreadable or truncated
+        return False
+
+
+def build_assets(static_folder, bundles=None):
+    """Build content-hashed bundles into <static>/dist and return {bundle name: hashed file name}.
+
+    Each bundle also gets .gz (and .br when brotli is installed) siblings so
+    they can be served precompressed. Unchanged bundles keep their hash, so
+    clients holding an immutable cached copy never re-download them.
+    """
+    bundles = BUNDLES if bundles is None else bundles
+    dist = os.path.join(static_folder, DIST_DIR)
+    os.makedirs(dist, exist_ok=True)
+
+    manifest = {}
+    for name, sources in bundles.items():
+        parts = []
+        for source in sources:
+            with open(os.path.join(static_folder, source), encoding='utf-8') as fh:
+                parts.append(_minify(name, fh.read()))
+        data = '\n'.join(parts).encode('utf-8')
+
+        stem, ext = os.path.splitext(name)
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        hashed = f"{stem}.{digest}{ext}"
+        manifest[name] = hashed
+
+        # files are served as immutable, so each variant is checked against the
+        # bundle rather than trusted because it exists
+        path = os.path.join(dist, hashed)
+        if not _is_current(path, data):
+            _write_atomic(path, data)
+        if not _is_current(path + '.gz', data, gzip.decompress):
+            _write_atomic(path + '.gz', gzip.compress(data, compresslevel=9))
+        if brotli is not None and not _is_current(path + '.br', data, brotli.decompress):
+            _write_atomic(path + '.br', brotli.compress(data, quality=11))
+
+    _write_atomic(os.path.join(dist, MANIFEST_NAME),
+                  json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    return manifest
+
+
+def accepts_encoding(accept_encodings, encoding):
+    """True when the client's Accept-Encoding allows `encoding` (q-values respected, so gzip;q=0 refuses it)."""
+    return accept_encodings[encoding] > 0
+
+
+def precompressed_variant(directory, filename, accept_encodings):
+    """Pick the best precompressed file for the client: (file name, encoding) or (filename, None)."""
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if accepts_encoding(accept_encodings, encoding) and os.path.exists(os.path.join(directory, filename + suffix)):
+            return filename + suffix, encoding
+    return filename, None
+
+
+def compress_response(response, accept_encodings):
+    """Compress a buffered text response on the fly (used for rendered HTML pages)."""
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or response.mimetype not in COMPRESSIBLE_TYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return response
+
+    if brotli is not None and accepts_encoding(accept_encodings, 'br'):
+        # a low quality keeps per-request CPU cost close to gzip
+        body, encoding = brotli.compress(data, quality=4), 'br'
+    elif accepts_encoding(accept_encodings, 'gzip'):
+        body, encoding = gzip.compress(data, compresslevel=6), 'gzip'
+    else:
+        return response
+
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    return response
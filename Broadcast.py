@@ -0,0 +1,145 @@
+import json
+import queue
+import threading
+from sqlalchemy import event
+
+
+class ChangeHub:
+    """In-process pub/sub used to push row change notifications to SSE clients.
+
+    Each subscriber gets its own bounded queue. Publishing never blocks: a
+    client that stops reading and fills its queue is dropped, its stream is
+    ended, and the browser's EventSource reconnects (re-loading the lists it
+    shows, since notifications were lost in between).
+    """
+
+    # queued in place of data to tell stream() its subscriber was dropped
+    CLOSED = None
+
+    def __init__(self, max_pending=100, keepalive_seconds=25):
+        self.max_pending = max_pending
+        self.keepalive_seconds = keepalive_seconds
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def subscribe(self):
+        q = queue.Queue(maxsize=self.max_pending)
+        with self._lock:
+            self._subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def publish(self, message):
+        data = json.dumps(message, separators=(',', ':'))
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for q in subscribers:
+            try:
+                q.put_nowait(data)
+            except queue.Full:
+                self._drop(q)
+
+    def _drop(self, q):
+        self.unsubscribe(q)
+        # discard the backlog so the close marker fits and is seen straight away
+        while True:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            q.put_nowait(self.CLOSED)
+        except queue.Full:
+            pass
+
+    def notify(self, model, created=(), updated=(), deleted=(), reload=False):
+        """Publish one change notification; used directly by set-based statements that skip ORM events.
+
+        `reload` tells clients the id lists are incomplete (too many rows changed)
+        and the whole list should be fetched again.
+        """
+        if not (created or updated or deleted or reload):
+            return
+        message = {
+            'model': model,
+            'created': sorted(created),
+            'updated': sorted(updated),
+            'deleted': sorted(deleted),
+        }
+        if reload:
+            message['reload'] = True
+        self.publish(message)
+
+    def stream(self):
+        """Generator yielding SSE frames until the client disconnects.
+
+        Idle clients sit in a blocking queue get; serve.py runs the app on
+        gevent with monkey patching, so that wait costs a greenlet rather than
+        an OS thread per open connection.
+        """
+        q = self.subscribe()
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    data = q.get(timeout=self.keepalive_seconds)
+                except queue.Empty:
+                    # comment frame keeps proxies from closing idle connections
+                    yield ": keepalive\n\n"
+                    continue
+                if data is self.CLOSED:
+                    return
+                yield f"event: change\ndata: {data}\n\n"
+        finally:
+            self.unsubscribe(q)
+
+
+# sessions already hooked by track_changes
+_tracked_sessions = set()
+
+
+def track_changes(session, hub, models):
+    """Publish created/updated/deleted ids for `models` after each commit.
+
+    `models` maps a model class to the name sent to clients, e.g. {Roster: 'roster'}.
+    Changes are collected on flush and only sent once the transaction commits,
+    so rolled back work is never announced. The listeners attach to the
+    session's class, which is shared by every app using the same `db`, so
+    repeat calls (one per create_app()) are ignored.
+    """
+    if session in _tracked_sessions:
+        return
+    _tracked_sessions.add(session)
+
+    def pending(sess):
+        return sess.info.setdefault('live_changes', {})
+
+    @event.listens_for(session, 'after_flush')
+    def collect(sess, flush_context):
+        changes = pending(sess)
+        for kind, objs in (('created', sess.new), ('updated', sess.dirty), ('deleted', sess.deleted)):
+            for obj in objs:
+                name = models.get(type(obj))
+                if name is None or obj.id is None:
+                    continue
+                if kind == 'updated' and not sess.is_modified(obj):
+                    continue
+                entry = changes.setdefault(name, {'created': set(), 'updated': set(), 'deleted': set()})
+                entry[kind].add(obj.id)
+
+    @event.listens_for(session, 'after_commit')
+    def send(sess):
+        changes = sess.info.pop('live_changes', None)
+        if not changes:
+            return
+        for name, entry in changes.items():
+            # a row created and touched again in the same transaction is just "created"
+            entry['updated'] -= entry['created'] | entry['deleted']
+            hub.notify(name, entry['created'], entry['updated'], entry['deleted'])
+
+    @event.listens_for(session, 'after_soft_rollback')
+    def discard(sess, previous_transaction):
+        sess.info.pop('live_changes', None)
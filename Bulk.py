@@ -0,0 +1,184 @@
+from sqlalchemy import select, insert, update, delete, case, func, literal, and_
+from Extensions import db, hub
+from Database import (Resource, Employee, Event, Roster, User, Qualification, ArchivedRoster, event_employee,
+                      event_resource, preset_resource, archived_event_employee, archived_event_resource)
+
+# Set-based versions of the single-row edit/delete views. Each function takes the
+# target rows as a SELECT of ids (see target_query) that is embedded as a subquery in
+# its UPDATE/DELETE statements, runs as one transaction and returns a summary dict of
+# row counts. Bulk statements bypass the session hooks in Broadcast.track_changes, so
+# changes are announced with hub.notify.
+
+# most ids listed in one notification; beyond that clients are told to reload the list
+NOTIFY_LIMIT = 500
+
+
+def target_query(model, ids=None, conditions=None):
+    """SELECT of the target ids: explicit ids, filter conditions, or both (intersection).
+
+    Returns None when neither is given, so a bare request never touches every row.
+    """
+    if not ids and not conditions:
+        return None
+    query = select(model.id)
+    if ids:
+        query = query.where(model.id.in_(ids))
+    if conditions:
+        query = query.where(and_(*conditions))
+    # the subquery reads the same table the UPDATE/DELETE writes; keep it self-contained
+    return query.correlate(None)
+
+
+def has_targets(target):
+    return target is not None and db.session.execute(select(target.exists())).scalar()
+
+
+def _sample(query):
+    """Ids for a notification, capped at NOTIFY_LIMIT: (ids, complete)."""
+    ids = db.session.execute(query.limit(NOTIFY_LIMIT + 1)).scalars().all()
+    return ids[:NOTIFY_LIMIT], len(ids) <= NOTIFY_LIMIT
+
+
+def _announce(model, kind, sample):
+    ids, complete = sample
+    hub.notify(model, reload=not complete, **{kind: ids})
+
+
+def _linked_events(table, column, target):
+    return _sample(select(table.c.event_id).where(table.c[column].in_(target)).distinct())
+
+
+def _run(work):
+    try:
+        result = work()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return result
+
+
+def _count(statement):
+    return db.session.execute(statement).rowcount
+
+
+def delete_resources(target):
+    def work():
+        # ids are read before the rows they come from are deleted
+        notices = [('resource', 'deleted', _sample(target)),
+                   ('event', 'updated', _linked_events(event_resource, 'resource_id', target))]
+        return notices, {
+            'event_links': _count(delete(event_resource).where(event_resource.c.resource_id.in_(target))),
+            'preset_links': _count(delete(preset_resource).where(preset_resource.c.resource_id.in_(target))),
+            # SQLite may reuse a deleted id, so history must not keep pointing at it
+            'archived_links': _count(delete(archived_event_resource).where(archived_event_resource.c.resource_id.in_(target))),
+            'deleted': _count(delete(Resource.__table__).where(Resource.id.in_(target))),
+        }
+
+    notices, summary = _run(work)
+    for notice in notices:
+        _announce(*notice)
+    return summary
+
+
+def update_resources(target, category=None, resource_type=None, qty=None, qty_delta=None):
+    """Reassign category/type and set or adjust qty for many resources in one UPDATE.
+
+    qty_delta is added to the current quantity, never going below zero.
+    """
+    values = {}
+    if category:
+        values['category'] = category
+    if resource_type:
+        values['type'] = resource_type
+    if qty is not None:
+        values['qty'] = max(qty, 0)
+    elif qty_delta:
+        adjusted = func.coalesce(Resource.qty, 0) + qty_delta
+        values['qty'] = case((adjusted < 0, 0), else_=adjusted)
+    if not values:
+        return {'updated': 0}
+
+    def work():
+        # sampled first: a category/type filter no longer matches once the UPDATE has run
+        changed = _sample(target)
+        return changed, {
+            'updated': _count(update(Resource.__table__).where(Resource.id.in_(target)).values(**values)),
+        }
+
+    changed, summary = _run(work)
+    _announce('resource', 'updated', changed)
+    return summary
+
+
+def delete_employees(target):
+    """Delete employees with their qualifications and event links; their users and rosters (live and archived) are unlinked."""
+    def work():
+        notices = [('event', 'updated', _linked_events(event_employee, 'employee_id', target)),
+                   ('roster', 'updated', _sample(select(Roster.id).where(Roster.employee_id.in_(target))))]
+        return notices, {
+            'event_links': _count(delete(event_employee).where(event_employee.c.employee_id.in_(target))),
+            'qualifications': _count(delete(Qualification.__table__).where(Qualification.employee_id.in_(target))),
+            'users_unlinked': _count(update(User.__table__).where(User.employee_id.in_(target)).values(employee_id=None)),
+            'rosters_unassigned': _count(update(Roster.__table__).where(Roster.employee_id.in_(target)).values(employee_id=None)),
+            # SQLite may reuse a deleted id, so history must not keep pointing at it
+            'archived_links': _count(delete(archived_event_employee).where(archived_event_employee.c.employee_id.in_(target))),
+            'archived_rosters_unassigned': _count(update(ArchivedRoster.__table__).where(ArchivedRoster.employee_id.in_(target)).values(employee_id=None)),
+            'deleted': _count(delete(Employee.__table__).where(Employee.id.in_(target))),
+        }
+
+    notices, summary = _run(work)
+    for notice in notices:
+        _announce(*notice)
+    return summary
+
+
+def delete_events(target):
+    def work():
+        deleted = _sample(target)
+        return deleted, {
+            'employee_links': _count(delete(event_employee).where(event_employee.c.event_id.in_(target))),
+            'resource_links': _count(delete(event_resource).where(event_resource.c.event_id.in_(target))),
+            'deleted': _count(delete(Event.__table__).where(Event.id.in_(target))),
+        }
+
+    deleted, summary = _run(work)
+    _announce('event', 'deleted', deleted)
+    return summary
+
+
+def reassign_event_employee(target, to_employee_id, from_employee_id=None):
+    """Put `to_employee_id` on the target events, replacing `from_employee_id` when one is given.
+
+    With from_employee_id only events currently staffed by that employee change;
+    without it the employee is added to every target event. Existing links are
+    never duplicated.
+    """
+    if from_employee_id == to_employee_id:
+        return {'added': 0, 'removed': 0}
+    link = event_employee.c
+    already_assigned = select(link.event_id).where(link.employee_id == to_employee_id)
+    if from_employee_id is not None:
+        events = select(link.event_id).where(link.event_id.in_(target), link.employee_id == from_employee_id) \
+            .distinct().correlate(None)
+    else:
+        events = target
+
+    def work():
+        changed = _sample(events)
+        # insert before removing the old links: `events` is defined by them
+        added = _count(insert(event_employee).from_select(
+            ['event_id', 'employee_id'],
+            select(Event.id, literal(to_employee_id, db.Integer))
+            .where(Event.id.in_(events), Event.id.not_in(already_assigned))
+        ))
+        removed = 0
+        if from_employee_id is not None:
+            removed = _count(delete(event_employee).where(
+                link.event_id.in_(events), link.employee_id == from_employee_id
+            ))
+        return changed, {'added': added, 'removed': removed}
+
+    changed, summary = _run(work)
+    _announce('event', 'updated', changed)
+    return summary
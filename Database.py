@@ -108,4 +108,46 @@ class Qualification(db.Model):
     expires_date = db.Column(db.Date)
 
     def __repr__(self):
-        return f"<Qualification {self.name} for employee {self.employee_id}>"
\ No newline at end of file
+        return f"<Qualification {self.name} for employee {self.employee_id}>"
+
+
+# --- Archive tables: past events/rosters moved out of the hot tables (see Archive.py) ---
+archived_event_employee = db.Table(
+    'archived_event_employee',
+    db.Column('event_id', db.Integer, db.ForeignKey('archived_event.id')),
+    db.Column('employee_id', db.Integer, db.ForeignKey('employee.id'))
+)
+
+archived_event_resource = db.Table(
+    'archived_event_resource',
+    db.Column('event_id', db.Integer, db.ForeignKey('archived_event.id')),
+    db.Column('resource_id', db.Integer, db.ForeignKey('resource.id'))
+)
+
+class ArchivedEvent(db.Model):
+    # copy of an Event row; event_id keeps the original id (SQLite may hand it out again)
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, index=True)
+    title = db.Column(db.String(200))
+    location = db.Column(db.String(200))
+    start_time = db.Column(db.DateTime, index=True)
+    end_time = db.Column(db.DateTime)
+    setup_minutes = db.Column(db.Integer, default=0)
+    packup_minutes = db.Column(db.Integer, default=0)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    employees = db.relationship("Employee", secondary=archived_event_employee)
+    resources = db.relationship("Resource", secondary=archived_event_resource)
+
+
+class ArchivedRoster(db.Model):
+    # copy of a Roster row; roster_id keeps the original id
+    id = db.Column(db.Integer, primary_key=True)
+    roster_id = db.Column(db.Integer, index=True)
+    date = db.Column(db.Date, nullable=False, index=True)
+    shift_name = db.Column(db.String(120), nullable=False)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employee.id'))
+    job_description = db.Column(db.String(255))
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    employee = db.relationship("Employee")
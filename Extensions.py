@@ -1,3 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from Broadcast import ChangeHub
 
 db = SQLAlchemy()
+hub = ChangeHub()
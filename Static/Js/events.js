@@ -0,0 +1,272 @@
+// Events page (admin): create/edit/delete event modals, presets and resource picker
+
+function openCreatePresetModal() {
+  document.getElementById('createPresetModal').style.display = 'flex';
+}
+function closeCreatePresetModal() {
+  document.getElementById('createPresetModal').style.display = 'none';
+}
+document.getElementById('createPresetBtn').addEventListener('click', function() {
+  openCreatePresetModal();
+});
+document.getElementById('createPresetModal')?.addEventListener('click', function(e) {
+  if (e.target === this) closeCreatePresetModal();
+});
+
+function openEditEventModal(eventId) {
+  fetch(`/events`).then(r => r.text()).then(html => {
+    // Find the event data in the rendered page context (edit_event)
+    // For a real app, use an API or inject data as JSON
+    // Here, we use a workaround: reload page with ?edit=eventId or use a hidden div/json
+    // For now, just open the modal and let user fill manually
+    document.getElementById('editEventModal').style.display = 'flex';
+    // Optionally, prefill fields if you have event data available in JS
+  });
+  document.getElementById('editEventForm').action = `/events/${eventId}/edit`;
+}
+function closeEditEventModal() {
+  document.getElementById('editEventModal').style.display = 'none';
+}
+document.getElementById('editEventModal')?.addEventListener('click', function(e) {
+  if (e.target === this) closeEditEventModal();
+});
+
+                // Prevent both modals from being open at once
+                function handlePresetSubmit(e) {
+                  // Close the presets modal after submit, do not open event modal
+                  setTimeout(() => closeManagePresets(), 100);
+                  return true;
+                }
+
+                // Ensure only one modal is open at a time
+
+                // Button event listeners for modals
+                document.getElementById('managePresetsBtn')?.addEventListener('click', function() {
+                  // Always close the create event modal if open
+                  document.getElementById('createEventModal').style.display = 'none';
+                  // Open the manage presets modal
+                  document.getElementById('managePresetsModal').style.display = 'flex';
+                });
+                document.getElementById('createEventBtn')?.addEventListener('click', function() {
+                  document.getElementById('managePresetsModal').style.display = 'none';
+                  document.getElementById('createEventModal').style.display = 'flex';
+                });
+
+                // Dedicated Create Preset button opens the modal directly to the create form
+                document.getElementById('createPresetBtn')?.addEventListener('click', function() {
+                  // Only open the preset modal, ensure event modal is closed
+                  document.getElementById('createEventModal').style.display = 'none';
+                  document.getElementById('createPresetModal').style.display = 'flex';
+                });
+                function closeCreatePresetForm() {
+                  document.getElementById('createPresetModal').style.display = 'none';
+                }
+                document.getElementById('createPresetModal')?.addEventListener('click', function(e) {
+                  if (e.target === this) closeCreatePresetForm();
+                });
+                function openManagePresets() {
+                  document.getElementById('createEventModal').style.display = 'none';
+                  document.getElementById('managePresetsModal').style.display = 'flex';
+                }
+                function closeManagePresets() {
+                  document.getElementById('managePresetsModal').style.display = 'none';
+                }
+                document.getElementById('managePresetsModal')?.addEventListener('click', function(e) {
+                  if (e.target === this) closeManagePresets();
+                });
+                function openCreateEventForm() {
+                  document.getElementById('managePresetsModal').style.display = 'none';
+                  document.getElementById('createEventModal').style.display = 'flex';
+                }
+// Calendar view buttons (placeholders)
+document.querySelectorAll('.btn.btn-secondary, .btn.btn-primary').forEach(btn => {
+  if (btn.textContent.includes('Day')) btn.onclick = () => alert('Day view coming soon!');
+  if (btn.textContent.includes('Week')) btn.onclick = () => alert('Week view coming soon!');
+  if (btn.textContent.includes('Month')) btn.onclick = () => alert('Month view coming soon!');
+  if (btn.textContent.includes('Today')) btn.onclick = () => alert('Today button coming soon!');
+});
+
+// Add Edit button functionality for events (placeholder)
+document.querySelectorAll('button').forEach(btn => {
+  if (btn.textContent.trim() === 'Edit') btn.onclick = () => alert('Edit event coming soon!');
+});
+
+// Ensure Create Event form submits
+document.querySelector('#createEventModal form')?.addEventListener('submit', function(e) {
+  // No preventDefault, allow normal submit
+});
+
+                // Ensure event form submits
+                document.querySelector('#createEventModal form')?.addEventListener('submit', function(e) {
+                  // No preventDefault, allow normal submit
+                });
+
+// PRESETS: data is stored on each <option> as a data-ids attribute to keep this script valid JS
+// (the preset -> resource-id mapping is read from the selected option at runtime)
+
+let selectedResourceIds = new Set();
+
+function openCreateEventForm() {
+  document.getElementById('createEventModal').style.display = 'flex';
+}
+
+function closeCreateEventForm() {
+  // clear temporary UI state when closing
+  selectedResourceIds.clear();
+  document.getElementById('selectedResources').innerHTML = '';
+  // remove any hidden inputs named resource_ids inside the create-event form
+  document.querySelectorAll('#createEventModal input[name="resource_ids"][type="hidden"]').forEach(n => n.remove());
+  document.getElementById('presetSelect').value = '';
+  document.getElementById('createEventModal').style.display = 'none';
+}
+
+function confirmDeleteEvent(eventId) {
+  if (confirm('Are you sure you want to delete this event? This action cannot be undone.')) {
+    const form = document.createElement('form');
+    form.method = 'POST';
+    form.action = `/events/${eventId}/delete`;
+    document.body.appendChild(form);
+    form.submit();
+  }
+}
+
+function addResourceFromList(id, code) {
+  addSelectedResource(id, code);
+}
+
+function addSelectedResource(id, code) {
+  const numericId = String(id);
+  if (selectedResourceIds.has(numericId)) return; // already added
+  selectedResourceIds.add(numericId);
+
+  // visual badge
+  const badge = document.createElement('span');
+  badge.className = 'selected-resource-badge';
+  badge.dataset.id = numericId;
+  badge.style.background = 'rgba(76, 175, 80, 0.08)';
+  badge.style.color = '#9de6a8';
+  badge.style.padding = '0.25rem 0.5rem';
+  badge.style.borderRadius = '4px';
+  badge.style.display = 'inline-flex';
+  badge.style.alignItems = 'center';
+  badge.style.gap = '0.5rem';
+  badge.innerHTML = `<strong style="font-weight:600; color:#e0e0e0;">${code}</strong> <button type="button" style="background:transparent; border:none; color:#ff6b6b; cursor:pointer;">✕</button>`;
+
+  badge.querySelector('button').addEventListener('click', () => removeSelectedResource(numericId));
+
+  document.getElementById('selectedResources').appendChild(badge);
+
+  // hidden input so Flask receives resource_ids (attach to the create-event form)
+  const hidden = document.createElement('input');
+  hidden.type = 'hidden';
+  hidden.name = 'resource_ids';
+  hidden.value = numericId;
+  hidden.dataset.for = `res-${numericId}`;
+  const createForm = document.querySelector('#createEventModal form');
+  if (createForm) createForm.appendChild(hidden);
+}
+
+function removeSelectedResource(id) {
+  selectedResourceIds.delete(String(id));
+  const badge = document.querySelector(`#selectedResources span[data-id='${id}']`);
+  if (badge) badge.remove();
+  // remove hidden input
+  document.querySelectorAll(`#createEventModal input[name=\"resource_ids\"][value=\"${id}\"]`).forEach(n => n.remove());
+}
+
+function applyPreset(presetId) {
+  // clear current selections
+  selectedResourceIds = new Set();
+  document.getElementById('selectedResources').innerHTML = '';
+  document.querySelectorAll('#createEventModal input[name="resource_ids"][type="hidden"]').forEach(n => n.remove());
+
+  if (!presetId) return;
+
+  const opt = document.querySelector(`#presetSelect option[value='${presetId}']`);
+  if (!opt) return;
+
+  // option.dataset.ids is like: "[1, 2, 3]"
+  let idsData = opt.dataset.ids || '[]';
+  let ids = [];
+  try {
+    ids = JSON.parse(idsData);
+  } catch (err) {
+    // fallback to comma-separated parsing
+    ids = idsData.replace(/[^0-9,]/g, '').split(',').filter(Boolean).map(s => s.trim());
+  }
+
+  ids.forEach(rid => {
+    const row = document.querySelector(`.resource-row[data-id='${rid}']`);
+    const code = row ? row.textContent.trim().split('—')[0].trim() : String(rid);
+    addSelectedResource(rid, code);
+  });
+}
+
+function filterResourceList() {
+  const q = (document.getElementById('resourceSearch').value || '').trim().toLowerCase();
+  document.querySelectorAll('.resource-row').forEach(row => {
+    const text = row.dataset.text || '';
+    row.style.display = q === '' || text.indexOf(q) !== -1 ? 'flex' : 'none';
+  });
+}
+
+// Manage Presets modal
+function openManagePresets() {
+  document.getElementById('managePresetsModal').style.display = 'flex';
+}
+function closeManagePresets() {
+  document.getElementById('managePresetsModal').style.display = 'none';
+}
+document.getElementById('managePresetsModal')?.addEventListener('click', function(e) {
+  if (e.target === this) closeManagePresets();
+});
+
+// Bulk selection: ticked events are submitted with #bulkEventForm
+function bulkChecked() {
+  return Array.from(document.querySelectorAll('.bulk-select:checked'));
+}
+
+function updateBulkCount() {
+  document.getElementById('bulkSelectedCount').textContent = bulkChecked().length;
+}
+
+function toggleBulkSelectAll(source) {
+  document.querySelectorAll('.bulk-select').forEach(box => { box.checked = source.checked; });
+  updateBulkCount();
+}
+
+function showBulkFields() {
+  const action = document.getElementById('bulkAction').value;
+  document.querySelectorAll('.bulk-fields').forEach(el => {
+    el.style.display = el.dataset.action === action ? 'flex' : 'none';
+  });
+}
+
+function confirmBulkAction() {
+  const count = bulkChecked().length;
+  if (!count) {
+    alert('Select at least one event.');
+    return false;
+  }
+  const action = document.getElementById('bulkAction').value;
+  if (action === 'reassign_employee' && !document.getElementById('bulkToEmployee').value) {
+    alert('Choose the employee to assign.');
+    return false;
+  }
+  if (action === 'delete') {
+    return confirm(`Delete ${count} events? This action cannot be undone.`);
+  }
+  return true;
+}
+
+// delegated so rows added by live updates are counted too
+document.addEventListener('change', (e) => {
+  if (e.target.classList.contains('bulk-select')) updateBulkCount();
+});
+
+// Close create modal when clicking outside
+document.getElementById('createEventModal').addEventListener('click', function(e) {
+  if (e.target === this) {
+    closeCreateEventForm();
+  }
+});
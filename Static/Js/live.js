@@ -0,0 +1,88 @@
+// Live updates: patch only the rows named in /live/changes notifications
+(function() {
+  const liveUrl = document.currentScript && document.currentScript.dataset.liveUrl;
+  const lists = {};
+  document.querySelectorAll('[data-live-list]').forEach(el => { lists[el.dataset.liveList] = el; });
+  if (!liveUrl || !Object.keys(lists).length || !window.EventSource) return;
+
+  const pending = {};
+  let timer = null;
+
+  function rowIn(root, id) {
+    return root.querySelector(`[data-live-row="${id}"]`);
+  }
+
+  function settle(model, reloaded) {
+    // keep the empty placeholder and row counters in step with the rows shown
+    const list = lists[model];
+    const rows = list.querySelectorAll('[data-live-row]').length;
+    if (rows) list.querySelector('[data-live-empty]')?.remove();
+    else if (!reloaded && !list.querySelector('[data-live-empty]')) return reloadList(model);
+    document.querySelectorAll(`[data-live-count="${model}"]`).forEach(el => { el.textContent = rows; });
+    // lets page scripts (e.g. the resources filter) re-apply themselves to new rows
+    list.dispatchEvent(new CustomEvent('live:changed', { bubbles: true }));
+  }
+
+  function flush() {
+    timer = null;
+    Object.keys(pending).forEach(model => {
+      const list = lists[model];
+      const ids = Array.from(pending[model]);
+      delete pending[model];
+      fetch(`${location.pathname}?ids=${ids.join(',')}`, { credentials: 'same-origin' })
+        .then(r => r.ok ? r.text() : Promise.reject(r.status))
+        .then(html => {
+          const doc = new DOMParser().parseFromString(html, 'text/html');
+          const fresh = doc.querySelector(`[data-live-list="${model}"]`);
+          ids.forEach(id => {
+            const current = rowIn(list, id);
+            const incoming = fresh && rowIn(fresh, id);
+            if (current && incoming) current.replaceWith(incoming);
+            else if (incoming) list.appendChild(incoming);
+            else if (current) current.remove();  // no longer visible to this user
+          });
+          settle(model);
+        })
+        .catch(() => {});
+    });
+  }
+
+  function reloadList(model) {
+    // full refresh of one list, used when notifications may have been missed
+    const list = lists[model];
+    fetch(location.pathname, { credentials: 'same-origin' })
+      .then(r => r.ok ? r.text() : Promise.reject(r.status))
+      .then(html => {
+        const doc = new DOMParser().parseFromString(html, 'text/html');
+        const fresh = doc.querySelector(`[data-live-list="${model}"]`);
+        if (!fresh) return;
+        list.innerHTML = fresh.innerHTML;
+        settle(model, true);
+      })
+      .catch(() => {});
+  }
+
+  const source = new EventSource(liveUrl);
+  let connectedBefore = false;
+  source.addEventListener('open', () => {
+    // the server ends a stream whose client fell behind; catch up after reconnecting
+    if (connectedBefore) Object.keys(lists).forEach(reloadList);
+    connectedBefore = true;
+  });
+  source.addEventListener('change', msg => {
+    const change = JSON.parse(msg.data);
+    const list = lists[change.model];
+    if (!list) return;
+    if (change.reload) {
+      reloadList(change.model);
+      return;
+    }
+    change.deleted.forEach(id => rowIn(list, id)?.remove());
+    const touched = change.created.concat(change.updated);
+    if (!touched.length) return settle(change.model);
+    pending[change.model] = pending[change.model] || new Set();
+    touched.forEach(id => pending[change.model].add(id));
+    // coalesce bursts of notifications into one fetch per model
+    if (!timer) timer = setTimeout(flush, 250);
+  });
+})();
@@ -0,0 +1,29 @@
+// Users page: confirm, then POST to the url stored on the button's data-action
+function submitUserAction(button) {
+  const form = document.createElement('form');
+  form.method = 'POST';
+  form.action = button.dataset.action;
+  document.body.appendChild(form);
+  form.submit();
+}
+
+function confirmDelete(button) {
+  const username = button.dataset.username;
+  if (confirm(`Are you sure you want to delete user "${username}"? This action cannot be undone.`)) {
+    submitUserAction(button);
+  }
+}
+
+function confirmPromote(button) {
+  const username = button.dataset.username;
+  if (confirm(`Promote "${username}" to Administrator? They will have access to all admin features.`)) {
+    submitUserAction(button);
+  }
+}
+
+function confirmDemote(button) {
+  const username = button.dataset.username;
+  if (confirm(`Demote "${username}" from Administrator? They will lose admin privileges.`)) {
+    submitUserAction(button);
+  }
+}
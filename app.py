@@ -1,9 +1,19 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, abort
+import os
+import mimetypes
+import click
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, abort, send_from_directory, jsonify
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
-from Extensions import db
-from Database import User, Resource, Employee, Roster, Event, ResourcePreset
-from datetime import datetime
+from Extensions import db, hub
+from Broadcast import track_changes
+from Assets import build_assets, precompressed_variant, compress_response, DIST_DIR
+from Database import User, Resource, Employee, Roster, Event, ResourcePreset, ArchivedEvent, ArchivedRoster
+from Archive import archive_before, archive_cutoff, DEFAULT_ARCHIVE_AFTER_DAYS
+from Bulk import (target_query, has_targets, delete_resources, update_resources, delete_employees, delete_events,
+                  reassign_event_employee)
+from datetime import datetime, timedelta, time
+from sqlalchemy import false
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import selectinload
 from functools import wraps
 
 
@@ -146,13 +156,111 @@ def admin_required(f):
     return wrapper
 
 
+def parse_ids(raw):
+    """Parse a comma separated id list (e.g. '3,7,12'), ignoring anything that is not an integer."""
+    ids = []
+    for part in (raw or '').split(','):
+        part = part.strip()
+        if part.isdigit():
+            ids.append(int(part))
+    return ids
+
+
+HISTORY_PAGE_SIZE = 50
+
+
+def date_arg(name):
+    """Optional YYYY-MM-DD query argument; invalid values are ignored."""
+    raw = (request.args.get(name) or '').strip()
+    try:
+        return datetime.strptime(raw, "%Y-%m-%d").date() if raw else None
+    except ValueError:
+        return None
+
+
+def bulk_params():
+    """Bulk endpoints accept a JSON object body or a regular form post."""
+    if not request.is_json:
+        return request.form
+    params = request.get_json(silent=True)
+    if not isinstance(params, dict):
+        abort(400)
+    return params
+
+
+def text_param(params, name):
+    value = params.get(name)
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        abort(400)
+    return value.strip()
+
+
+def bulk_target(model, params, filter_columns):
+    """SELECT of the rows chosen by a bulk request: an explicit `ids` list and/or equality filters.
+
+    JSON bodies pass filters as {"filter": {"category": "Ladders"}}; forms use filter_<column> fields.
+    """
+    if request.is_json:
+        raw_ids = params.get('ids') or []
+        if isinstance(raw_ids, list):
+            if not all(isinstance(i, (int, str)) and not isinstance(i, bool) for i in raw_ids):
+                abort(400)
+            raw_ids = ','.join(str(i) for i in raw_ids)
+        elif not isinstance(raw_ids, str):
+            abort(400)
+        filters = params.get('filter') or {}
+        if not isinstance(filters, dict):
+            abort(400)
+        filters = {col: text_param(filters, col) for col in filter_columns}
+    else:
+        raw_ids = ','.join(params.getlist('ids'))
+        filters = {col: params.get(f'filter_{col}') for col in filter_columns}
+    conditions = [getattr(model, col) == filters[col] for col in filter_columns if filters.get(col)]
+    return target_query(model, parse_ids(raw_ids), conditions)
+
+
+def optional_int(params, name):
+    value = params.get(name)
+    if value is None or str(value).strip() == '':
+        return None
+    # int() would quietly truncate JSON 1.5 and turn true into 1
+    if isinstance(value, (bool, float)):
+        abort(400)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        abort(400)
+
+
+def bulk_response(action, summary, endpoint):
+    if request.is_json:
+        return jsonify(action=action, **summary)
+    counts = ', '.join(f"{count} {key.replace('_', ' ')}" for key, count in summary.items())
+    flash(f"Bulk {action.replace('_', ' ')}: {counts}.")
+    return redirect(url_for(endpoint))
+
+
+def bulk_nothing_selected(endpoint):
+    if request.is_json:
+        return jsonify(error='No matching items.'), 400
+    flash('No matching items selected.')
+    return redirect(url_for(endpoint))
+
+
 def create_app():
     app = Flask(__name__)
     app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///rostering.db'
     app.config['SECRET_KEY'] = 'change-me'
+    # events/rosters older than this many days are moved to the archive tables by `flask archive`
+    app.config['ARCHIVE_AFTER_DAYS'] = DEFAULT_ARCHIVE_AFTER_DAYS
 
     db.init_app(app)
 
+    # push created/updated/deleted ids for these models to /live/changes subscribers
+    track_changes(db.session, hub, {Roster: 'roster', Event: 'event', Resource: 'resource'})
+
     login_manager = LoginManager()
     login_manager.login_view = "login"
     login_manager.init_app(app)
@@ -190,6 +298,35 @@ def create_app():
             # Do NOT drop tables or recreate DB. Instead, raise a clear error.
             raise RuntimeError("Database schema is out of sync with models. Please run a migration or add missing columns manually. No data was deleted.") from e
 
+    # ---------------- ASSETS ----------------
+
+    # minified, content-hashed bundles; templates reference them through asset_url('app.css')
+    asset_manifest = build_assets(app.static_folder)
+    asset_dir = os.path.join(app.static_folder, DIST_DIR)
+    app.jinja_env.globals['asset_url'] = lambda name: url_for('asset', filename=asset_manifest[name])
+
+    @app.route('/assets/<path:filename>')
+    def asset(filename):
+        # hashed names never change content, so clients may cache them forever
+        served, encoding = precompressed_variant(asset_dir, filename, request.accept_encodings)
+        response = send_from_directory(asset_dir, served, mimetype=mimetypes.guess_type(filename)[0])
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
+
+    @app.route('/sw.js')
+    def service_worker():
+        # served from the root so the worker's scope covers every page, /assets/ and /live/
+        response = send_from_directory(app.static_folder, 'sw.js', mimetype='application/javascript')
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    @app.after_request
+    def compress_html(response):
+        return compress_response(response, request.accept_encodings)
+
     # ---------------- LOGIN ----------------
 
     @app.route('/login', methods=['GET', 'POST'])
@@ -244,7 +381,12 @@ def create_app():
     @app.route('/resources')
     @login_required
     def resources():
-        return render_template('resources.html', resources=Resource.query.all())
+        # ?ids=1,2 renders only those rows; used by the live update script to patch changed rows
+        query = Resource.query
+        live_ids = parse_ids(request.args.get('ids'))
+        if live_ids:
+            query = query.filter(Resource.id.in_(live_ids))
+        return render_template('resources.html', resources=query.all())
 
     @app.route('/resources/<int:resource_id>')
     @login_required
@@ -368,24 +510,50 @@ def create_app():
     @admin_required
     def delete_resource(resource_id):
         resource = Resource.query.get_or_404(resource_id)
-        db.session.delete(resource)
-        db.session.commit()
-        flash(f"Resource '{resource.item_code}' deleted.")
+        item_code = resource.item_code
+        # same cleanup as the bulk path, including links from archived events
+        delete_resources(target_query(Resource, [resource.id]))
+        flash(f"Resource '{item_code}' deleted.")
         return redirect(url_for('resources'))
 
+    @app.route('/resources/bulk', methods=['POST'])
+    @login_required
+    @admin_required
+    def bulk_resources():
+        params = bulk_params()
+        action = params.get('action')
+        if action not in ('delete', 'reassign', 'adjust_qty'):
+            abort(400)
+        target = bulk_target(Resource, params, ('category', 'type'))
+        if not has_targets(target):
+            return bulk_nothing_selected('resources')
+        if action == 'delete':
+            summary = delete_resources(target)
+        elif action == 'reassign':
+            summary = update_resources(target, category=text_param(params, 'category'),
+                                       resource_type=text_param(params, 'type'))
+        else:
+            summary = update_resources(target, qty=optional_int(params, 'qty'),
+                                       qty_delta=optional_int(params, 'qty_delta'))
+        return bulk_response(action, summary, 'resources')
+
     # ---------------- ROSTERS ----------------
 
     @app.route('/rosters')
     @login_required
     def rosters():
+        query = Roster.query
+        live_ids = parse_ids(request.args.get('ids'))
+        if live_ids:
+            query = query.filter(Roster.id.in_(live_ids))
         if current_user.is_admin:
-            rosters_q = Roster.query.all()
+            rosters_q = query.all()
             employees_q = Employee.query.all()
         else:
             # non-admins only see rosters where they are the appointed employee
             if getattr(current_user, 'employee', None):
                 emp = current_user.employee
-                rosters_q = Roster.query.filter_by(employee_id=emp.id).all()
+                rosters_q = query.filter_by(employee_id=emp.id).all()
                 employees_q = [emp]
             else:
                 rosters_q = []
@@ -409,10 +577,23 @@ def create_app():
     @admin_required
     def delete_employee(employee_id):
         employee = Employee.query.get_or_404(employee_id)
-        db.session.delete(employee)
-        db.session.commit()
+        # same cleanup as the bulk path, including archived rosters and events
+        delete_employees(target_query(Employee, [employee.id]))
         return redirect(url_for('employees_overview'))
 
+    @app.route('/employees/bulk', methods=['POST'])
+    @login_required
+    @admin_required
+    def bulk_employees():
+        params = bulk_params()
+        action = params.get('action')
+        if action != 'delete':
+            abort(400)
+        target = bulk_target(Employee, params, ('training_status', 'level_of_training'))
+        if not has_targets(target):
+            return bulk_nothing_selected('employees_overview')
+        return bulk_response(action, delete_employees(target), 'employees_overview')
+
     @app.route('/employees/new', methods=['POST'])
     @login_required
     @admin_required
@@ -455,8 +636,12 @@ def create_app():
     @app.route('/events')
     @login_required
     def events():
+        query = Event.query
+        live_ids = parse_ids(request.args.get('ids'))
+        if live_ids:
+            query = query.filter(Event.id.in_(live_ids))
         return render_template('events.html',
-                               events=Event.query.all(),
+                               events=query.all(),
                                employees=Employee.query.all(),
                                resources=Resource.query.all(),
                                presets=ResourcePreset.query.all())
@@ -536,6 +721,77 @@ def create_app():
         db.session.commit()
         return redirect(url_for('events'))
 
+    @app.route('/events/bulk', methods=['POST'])
+    @login_required
+    @admin_required
+    def bulk_events():
+        params = bulk_params()
+        action = params.get('action')
+        if action not in ('delete', 'reassign_employee'):
+            abort(400)
+        target = bulk_target(Event, params, ('location',))
+        if not has_targets(target):
+            return bulk_nothing_selected('events')
+        if action == 'delete':
+            summary = delete_events(target)
+        elif action == 'reassign_employee':
+            to_employee_id = optional_int(params, 'to_employee_id')
+            if to_employee_id is None or not Employee.query.get(to_employee_id):
+                abort(400)
+            summary = reassign_event_employee(target, to_employee_id, optional_int(params, 'from_employee_id'))
+        return bulk_response(action, summary, 'events')
+
+    # ---------------- HISTORY / ARCHIVE ----------------
+
+    @app.route('/history/events')
+    @login_required
+    def history_events():
+        # the archive only grows, so it is always read a date range / page at a time
+        start, end = date_arg('start'), date_arg('end')
+        query = ArchivedEvent.query.options(selectinload(ArchivedEvent.employees),
+                                            selectinload(ArchivedEvent.resources))
+        if start:
+            query = query.filter(ArchivedEvent.start_time >= datetime.combine(start, time.min))
+        if end:
+            query = query.filter(ArchivedEvent.start_time < datetime.combine(end + timedelta(days=1), time.min))
+        page = query.order_by(ArchivedEvent.start_time.desc()).paginate(
+            page=request.args.get('page', 1, type=int), per_page=HISTORY_PAGE_SIZE, error_out=False)
+        return render_template('history_events.html', events=page.items, page=page, start=start, end=end)
+
+    @app.route('/history/rosters')
+    @login_required
+    def history_rosters():
+        start, end = date_arg('start'), date_arg('end')
+        query = ArchivedRoster.query.options(selectinload(ArchivedRoster.employee))
+        if start:
+            query = query.filter(ArchivedRoster.date >= start)
+        if end:
+            query = query.filter(ArchivedRoster.date <= end)
+        if not current_user.is_admin:
+            # same rule as the live rosters page: non-admins only see their own shifts
+            emp = getattr(current_user, 'employee', None)
+            query = query.filter(ArchivedRoster.employee_id == emp.id) if emp else query.filter(false())
+        page = query.order_by(ArchivedRoster.date.desc()).paginate(
+            page=request.args.get('page', 1, type=int), per_page=HISTORY_PAGE_SIZE, error_out=False)
+        return render_template('history_rosters.html', rosters=page.items, page=page, start=start, end=end)
+
+    @app.route('/archive/run', methods=['POST'])
+    @login_required
+    @admin_required
+    def run_archive():
+        cutoff = archive_cutoff(app.config['ARCHIVE_AFTER_DAYS'])
+        moved = archive_before(cutoff)
+        flash(f"Archived {moved['events']} events and {moved['rosters']} rosters older than {cutoff.strftime('%d %b %Y')}.")
+        return redirect(url_for('history_events'))
+
+    @app.cli.command('archive')
+    @click.option('--days', type=int, default=None, help='Archive rows older than this many days.')
+    def archive_command(days):
+        """Move old events and rosters into the archive tables."""
+        cutoff = archive_cutoff(days if days is not None else app.config['ARCHIVE_AFTER_DAYS'])
+        moved = archive_before(cutoff)
+        click.echo(f"Archived {moved['events']} events and {moved['rosters']} rosters older than {cutoff:%Y-%m-%d}.")
+
     # ---------------- PRESETS ----------------
 
     @app.route('/presets/new', methods=['POST'])
@@ -569,6 +825,18 @@ def create_app():
         flash(f"Preset '{p.name}' deleted.")
         return redirect(url_for('events'))
 
+    # ---------------- LIVE UPDATES ----------------
+
+    @app.route('/live/changes')
+    @login_required
+    def live_changes():
+        # Server-Sent Events stream of {model, created, updated, deleted} id lists.
+        # Clients re-fetch only the affected rows via the list views' ?ids= filter.
+        return Response(hub.stream(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        })
+
     # ---------- USER MANAGEMENT ----------
 
     @app.route('/users/<int:user_id>/delete', methods=['POST'])
@@ -614,5 +882,6 @@ def create_app():
 
 
 if __name__ == "__main__":
+    # development server; use serve.py (gevent) when many live-update streams stay open
     app = create_app()
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""Production entrypoint: serve the app on gevent's cooperative WSGI server.
+
+Each open /live/changes stream is an idle greenlet waiting on its queue rather
+than a parked OS thread, so hundreds of supervisor tabs can stay connected.
+`python app.py` (Flask's threaded dev server) still costs one thread per stream.
+
+    python serve.py [--host 0.0.0.0] [--port 8000]
+
+or equivalently under gunicorn: gunicorn -k gevent -w 1 "app:create_app()"
+(one worker: the change hub is in-process, so every client must share it).
+"""
+from gevent import monkey
+
+# must run before anything imports threading/queue/socket
+monkey.patch_all()
+
+import argparse
+from gevent.pywsgi import WSGIServer
+from app import create_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    server = WSGIServer((args.host, args.port), create_app())
+    print(f"Serving on http://{args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()